@@ -20,6 +20,10 @@ stimuli_dir = cwd / "stimuli"
 print(f"Stimuli directory: {stimuli_dir}")
 print(f"Stimuli exists: {stimuli_dir.exists()}")
 
+# File sizes seen while listing directories, reused for the expected-file checks
+video_sizes = {}
+audio_sizes = {}
+
 if stimuli_dir.exists():
     # Check videos directory
     videos_dir = stimuli_dir / "videos"
@@ -29,17 +33,20 @@ if stimuli_dir.exists():
     if videos_dir.exists():
         print(f"\n📁 Files in videos directory:")
         try:
-            all_files = list(videos_dir.glob("*"))
+            # scandir entries carry their file type, and their stat is cached per entry
+            with os.scandir(videos_dir) as entries:
+                all_files = sorted(entries, key=lambda entry: entry.name)
             if all_files:
-                for file_path in sorted(all_files):
-                    if file_path.is_file():
-                        size_mb = file_path.stat().st_size / (1024*1024)
-                        print(f"   ✅ {file_path.name} ({size_mb:.1f} MB)")
+                for entry in all_files:
+                    if entry.is_file():
+                        video_sizes[entry.name] = entry.stat().st_size
+                        size_mb = video_sizes[entry.name] / (1024*1024)
+                        print(f"   ✅ {entry.name} ({size_mb:.1f} MB)")
                     else:
-                        print(f"   📁 {file_path.name}/ (directory)")
+                        print(f"   📁 {entry.name}/ (directory)")
             else:
                 print("   ❌ No files found in videos directory")
-        except Exception as e:
+        except OSError as e:
             print(f"   ❌ Error listing files: {e}")
     
     # Check audio directory too
@@ -50,14 +57,17 @@ if stimuli_dir.exists():
     if audio_dir.exists():
         print(f"📁 Files in audio directory:")
         try:
-            audio_files = list(audio_dir.glob("*.wav"))
+            with os.scandir(audio_dir) as entries:
+                audio_files = sorted((entry for entry in entries if entry.name.lower().endswith(".wav")),
+                                     key=lambda entry: entry.name)
             if audio_files:
-                for file_path in sorted(audio_files):
-                    size_kb = file_path.stat().st_size / 1024
-                    print(f"   ✅ {file_path.name} ({size_kb:.1f} KB)")
+                for entry in audio_files:
+                    audio_sizes[entry.name] = entry.stat().st_size
+                    size_kb = audio_sizes[entry.name] / 1024
+                    print(f"   ✅ {entry.name} ({size_kb:.1f} KB)")
             else:
                 print("   ❌ No .wav files found in audio directory")
-        except Exception as e:
+        except OSError as e:
             print(f"   ❌ Error listing audio files: {e}")
 
 # Expected video files
@@ -75,26 +85,35 @@ print(f"\n🔍 Expected video files:")
 videos_dir = stimuli_dir / "videos"
 for video_name in expected_videos:
     video_path = videos_dir / video_name
-    exists = video_path.exists()
-    status = "✅" if exists else "❌"
-    print(f"   {status} {video_name}")
-    if exists:
-        size_mb = video_path.stat().st_size / (1024*1024)
-        print(f"      Size: {size_mb:.1f} MB")
-        print(f"      Full path: {video_path}")
+    # A single stat doubles as the existence check, skipped if the listing saw the file
+    size = video_sizes.get(video_name)
+    if size is None:
+        try:
+            size = os.stat(video_path).st_size
+        except OSError:
+            print(f"   ❌ {video_name}")
+            continue
+    size_mb = size / (1024*1024)
+    print(f"   ✅ {video_name}")
+    print(f"      Size: {size_mb:.1f} MB")
+    print(f"      Full path: {video_path}")
 
 print(f"\n🔍 Expected audio files:")
 audio_dir = stimuli_dir / "audio"
 expected_audio = ['positive_music.wav', 'negative_music.wav']
 for audio_name in expected_audio:
     audio_path = audio_dir / audio_name
-    exists = audio_path.exists()
-    status = "✅" if exists else "❌"
-    print(f"   {status} {audio_name}")
-    if exists:
-        size_kb = audio_path.stat().st_size / 1024
-        print(f"      Size: {size_kb:.1f} KB")
-        print(f"      Full path: {audio_path}")
+    size = audio_sizes.get(audio_name)
+    if size is None:
+        try:
+            size = os.stat(audio_path).st_size
+        except OSError:
+            print(f"   ❌ {audio_name}")
+            continue
+    size_kb = size / 1024
+    print(f"   ✅ {audio_name}")
+    print(f"      Size: {size_kb:.1f} KB")
+    print(f"      Full path: {audio_path}")
 
 print(f"\n" + "=" * 40)
 print("Check complete. If files show as missing, either:")
@@ -169,6 +169,21 @@ VELTEN_STATEMENTS = {
     ]
 }
 
+# Number of Velten statements shown per phase in demo mode
+DEMO_VELTEN_STATEMENT_COUNT = 2
+
+# Demo-mode statement sets, sliced once here instead of on every induction phase
+DEMO_VELTEN_STATEMENTS = {
+    set_key: tuple(statements[:DEMO_VELTEN_STATEMENT_COUNT])
+    for set_key, statements in VELTEN_STATEMENTS.items()
+}
+
+def get_velten_statements(set_key, demo=False):
+    """Return a fresh list of the statements in a Velten set (shortened in demo mode)."""
+    if demo:
+        return list(DEMO_VELTEN_STATEMENTS[set_key])
+    return list(VELTEN_STATEMENTS[set_key])
+
 # Velten statement usage mapping for counterbalancing
 # Set A used during initial induction, Set B used during re-induction
 VELTEN_SET_MAPPING = {
@@ -182,20 +197,37 @@ VELTEN_SET_MAPPING = {
     }
 }
 
+# SART block structure for demo and full runs (applied by set_demo_mode)
+SART_DEMO_STRUCTURE = {
+    'total_trials': 2,          # Demo: 2 trials
+    'steps_per_block': 1,       # Demo: 1 step (2 trials + MW probe)
+    'trials_per_step_min': 2,
+    'trials_per_step_max': 2,
+}
+SART_FULL_STRUCTURE = {
+    'total_trials': 120,        # Full: 120 trials
+    'steps_per_block': 8,       # Full: 8 steps, each followed by a MW probe
+    'trials_per_step_min': 13,  # Full: 13-17 trials per step
+    'trials_per_step_max': 17,
+}
+
 # SART Task Parameters
 SART_PARAMS = {
     'digits': list(range(10)),  # 0-9
     'target_digit': 3,  # No-go stimulus for inhibition condition
-    'total_trials': 2 if DEMO_MODE else 120,  # Demo: 2 trials, Full: 120 trials
-    'steps_per_block': 1 if DEMO_MODE else 8,  # Demo: 1 step (2 trials + MW probe), Full: 8 steps
-    'trials_per_step_min': 2 if DEMO_MODE else 13,  # Demo: 2 trials, Full: 13-17 trials
-    'trials_per_step_max': 2 if DEMO_MODE else 17,  # Demo: 2 trials, Full: 13-17 trials
+    **(SART_DEMO_STRUCTURE if DEMO_MODE else SART_FULL_STRUCTURE),
     'stimulus_duration': 0.5,  # 500ms
     'isi_duration': 2.0,  # 2000ms inter-stimulus interval
     'max_response_time': 2.5,  # 2500ms - Response window covers full trial duration
     'response_keys': ['left', 'right']
 }
 
+def set_demo_mode(enabled):
+    """Switch DEMO_MODE and the SART block structure between the demo and full settings."""
+    global DEMO_MODE
+    DEMO_MODE = enabled
+    SART_PARAMS.update(SART_DEMO_STRUCTURE if enabled else SART_FULL_STRUCTURE)
+
 # Screen dimensions and colors
 SCREEN_PARAMS = {
     'size': [1920, 1080],       # High resolution for better video quality
@@ -38,22 +38,24 @@ for dir_name in key_dirs:
             if subdir_exists and subdir == 'videos':
                 # List video files
                 try:
-                    video_files = list(subdir_path.glob("*.mp4"))
+                    with os.scandir(subdir_path) as entries:
+                        video_files = [entry for entry in entries if entry.name.lower().endswith(".mp4")]
                     print(f"         Video files found: {len(video_files)}")
                     for video_file in video_files:
                         size_mb = video_file.stat().st_size / (1024*1024)
                         print(f"         - {video_file.name} ({size_mb:.1f} MB)")
-                except Exception as e:
+                except OSError as e:
                     print(f"         Error listing videos: {e}")
             elif subdir_exists and subdir == 'audio':
                 # List audio files
                 try:
-                    audio_files = list(subdir_path.glob("*.wav"))
+                    with os.scandir(subdir_path) as entries:
+                        audio_files = [entry for entry in entries if entry.name.lower().endswith(".wav")]
                     print(f"         Audio files found: {len(audio_files)}")
                     for audio_file in audio_files:
                         size_kb = audio_file.stat().st_size / 1024
                         print(f"         - {audio_file.name} ({size_kb:.1f} KB)")
-                except Exception as e:
+                except OSError as e:
                     print(f"         Error listing audio: {e}")
 
 # Test config import
@@ -68,8 +70,18 @@ try:
     
     # Test specific video file paths
     print(f"\n🎬 Video file path test:")
+    # One directory listing per parent folder; names it doesn't match exactly are
+    # still checked with exists(), which honours case-insensitive filesystems
+    existing_names = {}
     for video_key, video_path in config.VIDEO_FILES.items():
-        exists = video_path.exists()
+        parent = video_path.parent
+        if parent not in existing_names:
+            try:
+                with os.scandir(parent) as entries:
+                    existing_names[parent] = {entry.name for entry in entries}
+            except OSError:
+                existing_names[parent] = set()
+        exists = video_path.name in existing_names[parent] or video_path.exists()
         status = "✅" if exists else "❌"
         print(f"   {status} {video_key}: {video_path}")
         
@@ -7,19 +7,20 @@ Cross-platform: Windows, macOS, and Linux
 
 import sys
 import os
-import platform
 from pathlib import Path
 import warnings
 
 # Create a custom stream that filters out RGB warnings
 class FilteredStream:
+    FILTERED_PATTERNS = ('RGB parameter is deprecated', 'fillRGB', 'lineRGB', 'Font b\'Helvetica Bold\' was requested')
+
     def __init__(self, stream):
         self.stream = stream
         
     def write(self, text):
         # Filter out RGB-related warnings
-        if any(x in str(text) for x in ['RGB parameter is deprecated', 'fillRGB', 'lineRGB',
-                                         'Font b\'Helvetica Bold\' was requested']):
+        message = str(text)
+        if any(pattern in message for pattern in self.FILTERED_PATTERNS):
             return
         self.stream.write(text)
     
@@ -38,11 +39,12 @@ warnings.filterwarnings('ignore', message='.*fillRGB.*deprecated.*')
 warnings.filterwarnings('ignore', message='.*lineRGB.*deprecated.*')
 
 # Add config to path
-sys.path.append(str(Path(__file__).parent / 'config'))
+config_dir = str(Path(__file__).parent / 'config')
+if config_dir not in sys.path:
+    sys.path.append(config_dir)
 
 # Platform-specific setup
-system = platform.system()
-if system == 'Linux':
+if sys.platform == 'linux':
     # Linux-specific optimizations
     os.environ['QT_AUTO_SCREEN_SCALE_FACTOR'] = '1'  # Better Qt scaling
     # Set SDL audio driver for better compatibility
@@ -57,12 +59,12 @@ if system == 'Linux':
     warnings.filterwarnings('ignore', message='.*lineRGB.*')
     print(f"🐧 Linux detected - applying Linux-specific optimizations...")
     print(f"   Audio backend: PulseAudio")
-elif system == 'Darwin':
+elif sys.platform == 'darwin':
     print(f"🍎 macOS detected - for Mac-specific optimizations use mac_demo_experiment.py")
-elif system == 'Windows':
+elif sys.platform == 'win32':
     print(f"🪟 Windows detected")
 else:
-    print(f"⚠️ Unknown platform: {system}")
+    print(f"⚠️ Unknown platform: {sys.platform}")
 
 def setup_display_config():
     """Setup display configuration using automatic detection"""
@@ -90,21 +92,15 @@ def setup_display_config():
 
 # Clear any cached modules to ensure fresh import
 import sys
-if 'config.experiment_config' in sys.modules:
-    del sys.modules['config.experiment_config']
-if 'experiment_config' in sys.modules:
-    del sys.modules['experiment_config']
+sys.modules.pop('config.experiment_config', None)
+sys.modules.pop('experiment_config', None)
 
 # Import config FIRST before anything else
 import config.experiment_config as config
 
 # Force demo mode
 print("🔧 Configuring DEMO mode...")
-config.DEMO_MODE = True
-config.SART_PARAMS['total_trials'] = 2  # Only 2 trials for ultra-quick demo
-config.SART_PARAMS['steps_per_block'] = 1  # Only 1 step (2 trials)
-config.SART_PARAMS['trials_per_step_min'] = 2  # 2 trials per step
-config.SART_PARAMS['trials_per_step_max'] = 2  # 2 trials per step
+config.set_demo_mode(True)
 print(f"✅ DEMO_MODE = {config.DEMO_MODE}")
 print(f"✅ SART trials = {config.SART_PARAMS['total_trials']} (2 trials, then 1 MW probe at end of block)")
 
@@ -121,7 +117,7 @@ def main():
     try:
         print("\n" + "="*60)
         print("🎯 STARTING DEMO EXPERIMENT")
-        print(f"   Platform: {platform.system()} {platform.release()}")
+        print(f"   Platform: {sys.platform}")
         print("="*60)
         
         # Setup display configuration with auto-detection
@@ -12,13 +12,15 @@ from pathlib import Path
 
 # Create a custom stream that filters out RGB warnings
 class FilteredStream:
+    FILTERED_PATTERNS = ('RGB parameter is deprecated', 'fillRGB', 'lineRGB', 'Font b\'Helvetica Bold\' was requested')
+
     def __init__(self, stream):
         self.stream = stream
         
     def write(self, text):
         # Filter out RGB-related warnings and other repetitive warnings
-        if any(x in str(text) for x in ['RGB parameter is deprecated', 'fillRGB', 'lineRGB',
-                                         'Font b\'Helvetica Bold\' was requested']):
+        message = str(text)
+        if any(pattern in message for pattern in self.FILTERED_PATTERNS):
             return
         self.stream.write(text)
     
@@ -32,11 +34,27 @@ class FilteredStream:
 sys.stderr = FilteredStream(sys.stderr)
 
 # Suppress Mac-specific warnings that don't affect functionality
-warnings.filterwarnings("ignore", message=".*Monitor specification not found.*")
-warnings.filterwarnings("ignore", message=".*Couldn't measure a consistent frame rate.*")
-warnings.filterwarnings("ignore", message=".*fillRGB parameter is deprecated.*")
-warnings.filterwarnings("ignore", message=".*lineRGB parameter is deprecated.*")
-warnings.filterwarnings("ignore", message=".*RGB parameter is deprecated.*")
+MAC_WARNING_PATTERNS = (
+    ".*Monitor specification not found.*",
+    ".*Couldn't measure a consistent frame rate.*",
+    ".*fillRGB parameter is deprecated.*",
+    ".*lineRGB parameter is deprecated.*",
+    ".*RGB parameter is deprecated.*",
+    ".*Font.*was requested. No similar font found.*",
+    ".*t of last frame was.*",
+    ".*Multiple dropped frames.*",
+    ".*Font Manager failed to load.*",
+    ".*Boolean HIDBuildMultiDeviceList.*",
+    ".*PsychHID-ERROR.*",
+    ".*PsychHID-INFO.*",
+    ".*PsychHID-WARNING.*",
+    # Tkinter theme debug output
+    ".*ThemeChanged.*",
+    ".*ttk::ThemeChanged.*",
+)
+# One combined filter instead of one per pattern, so each emitted warning is
+# matched against a single compiled regex
+warnings.filterwarnings("ignore", message="|".join(f"(?:{pattern})" for pattern in MAC_WARNING_PATTERNS))
 
 # Override warning handler to completely suppress RGB warnings
 original_showwarning = warnings.showwarning
@@ -46,18 +64,6 @@ def filtered_showwarning(message, category, filename, lineno, file=None, line=No
         return  # Skip RGB warnings entirely
     original_showwarning(message, category, filename, lineno, file, line)
 warnings.showwarning = filtered_showwarning
-warnings.filterwarnings("ignore", message=".*Font.*was requested. No similar font found.*")
-warnings.filterwarnings("ignore", message=".*t of last frame was.*")
-warnings.filterwarnings("ignore", message=".*Multiple dropped frames.*")
-warnings.filterwarnings("ignore", message=".*Font Manager failed to load.*")
-warnings.filterwarnings("ignore", message=".*Boolean HIDBuildMultiDeviceList.*")
-warnings.filterwarnings("ignore", message=".*PsychHID-ERROR.*")
-warnings.filterwarnings("ignore", message=".*PsychHID-INFO.*")
-warnings.filterwarnings("ignore", message=".*PsychHID-WARNING.*")
-
-# Suppress Tkinter theme debug output
-warnings.filterwarnings("ignore", message=".*ThemeChanged.*")
-warnings.filterwarnings("ignore", message=".*ttk::ThemeChanged.*")
 
 # Suppress stderr output during tkinter operations
 os.environ['TK_SILENCE_DEPRECATION'] = '1'
@@ -94,7 +100,9 @@ if sys.platform == 'darwin':  # macOS
         return contextlib.redirect_stderr(io.StringIO())
 
 # Add config to path
-sys.path.append(str(Path(__file__).parent / 'config'))
+config_dir = str(Path(__file__).parent / 'config')
+if config_dir not in sys.path:
+    sys.path.append(config_dir)
 
 def setup_display_config():
     """Setup display configuration using automatic detection"""
@@ -116,12 +124,12 @@ def setup_display_config():
     
     return layout_config
 
-# Clear any cached modules to ensure fresh import
+# Clear any cached modules to ensure fresh import (main_experiment too, so it
+# binds to the configured module below)
 import sys
-if 'experiment_config' in sys.modules:
-    del sys.modules['experiment_config']
-if 'config.experiment_config' in sys.modules:
-    del sys.modules['config.experiment_config']
+sys.modules.pop('experiment_config', None)
+sys.modules.pop('config.experiment_config', None)
+sys.modules.pop('main_experiment', None)
 
 # Import and configure experiment config FIRST
 from config import experiment_config as config
@@ -130,15 +138,11 @@ from config import experiment_config as config
 print("🔧 CONFIGURING DEMO MODE - FORCED OVERRIDE")
 print(f"   Script: {__file__}")
 print(f"   Config module: {config.__file__}")
-print(f"   Before: DEMO_MODE = {getattr(config, 'DEMO_MODE', 'NOT_SET')}")
-print(f"   Before: SART trials = {config.SART_PARAMS.get('total_trials', 'NOT_SET')}")
+print(f"   Before: DEMO_MODE = {config.DEMO_MODE}")
+print(f"   Before: SART trials = {config.SART_PARAMS['total_trials']}")
 
 # FORCE demo mode settings with absolute certainty
-config.DEMO_MODE = True
-config.SART_PARAMS['total_trials'] = 2  # Ultra-short: 2 trials, then 1 MW probe at end
-config.SART_PARAMS['steps_per_block'] = 1  # Only 1 step per block
-config.SART_PARAMS['trials_per_step_min'] = 2  # 2 trials per step
-config.SART_PARAMS['trials_per_step_max'] = 2  # 2 trials per step
+config.set_demo_mode(True)
 
 # Double-check the assignment worked
 print(f"   After: DEMO_MODE = {config.DEMO_MODE}")
@@ -160,18 +164,12 @@ print(f"   ⏱️  Total estimated time: ~5-10 minutes")
 print("=" * 60)
 
 # Force the config module in sys.modules so main_experiment gets our modified version
-sys.modules['experiment_config'] = config
-sys.modules['config.experiment_config'] = config
+sys.modules.update({'experiment_config': config, 'config.experiment_config': config})
 
 # Now import main experiment class AFTER configuration is set
 print("📦 Importing main experiment class...")
 print(f"   Forcing config module in sys.modules...")
 
-# Clear main_experiment from cache if it exists
-if 'main_experiment' in sys.modules:
-    del sys.modules['main_experiment']
-    print("   Cleared main_experiment from cache")
-
 try:
     if sys.platform == 'darwin':
         with suppress_hid_output():
@@ -11,22 +11,26 @@ import warnings
 from pathlib import Path
 
 # Suppress Mac-specific warnings that don't affect functionality
-warnings.filterwarnings("ignore", message=".*Monitor specification not found.*")
-warnings.filterwarnings("ignore", message=".*Couldn't measure a consistent frame rate.*")
-warnings.filterwarnings("ignore", message=".*fillRGB parameter is deprecated.*")
-warnings.filterwarnings("ignore", message=".*lineRGB parameter is deprecated.*")
-warnings.filterwarnings("ignore", message=".*Font.*was requested. No similar font found.*")
-warnings.filterwarnings("ignore", message=".*t of last frame was.*")
-warnings.filterwarnings("ignore", message=".*Multiple dropped frames.*")
-warnings.filterwarnings("ignore", message=".*Font Manager failed to load.*")
-warnings.filterwarnings("ignore", message=".*Boolean HIDBuildMultiDeviceList.*")
-warnings.filterwarnings("ignore", message=".*PsychHID-ERROR.*")
-warnings.filterwarnings("ignore", message=".*PsychHID-INFO.*")
-warnings.filterwarnings("ignore", message=".*PsychHID-WARNING.*")
-
-# Suppress Tkinter theme debug output
-warnings.filterwarnings("ignore", message=".*ThemeChanged.*")
-warnings.filterwarnings("ignore", message=".*ttk::ThemeChanged.*")
+MAC_WARNING_PATTERNS = (
+    ".*Monitor specification not found.*",
+    ".*Couldn't measure a consistent frame rate.*",
+    ".*fillRGB parameter is deprecated.*",
+    ".*lineRGB parameter is deprecated.*",
+    ".*Font.*was requested. No similar font found.*",
+    ".*t of last frame was.*",
+    ".*Multiple dropped frames.*",
+    ".*Font Manager failed to load.*",
+    ".*Boolean HIDBuildMultiDeviceList.*",
+    ".*PsychHID-ERROR.*",
+    ".*PsychHID-INFO.*",
+    ".*PsychHID-WARNING.*",
+    # Tkinter theme debug output
+    ".*ThemeChanged.*",
+    ".*ttk::ThemeChanged.*",
+)
+# One combined filter instead of one per pattern, so each emitted warning is
+# matched against a single compiled regex
+warnings.filterwarnings("ignore", message="|".join(f"(?:{pattern})" for pattern in MAC_WARNING_PATTERNS))
 
 # Suppress stderr output during tkinter operations
 os.environ['TK_SILENCE_DEPRECATION'] = '1'
@@ -63,7 +67,9 @@ if sys.platform == 'darwin':
         return contextlib.redirect_stderr(io.StringIO())
 
 # Add config to path
-sys.path.append(str(Path(__file__).parent / 'config'))
+config_dir = str(Path(__file__).parent / 'config')
+if config_dir not in sys.path:
+    sys.path.append(config_dir)
 
 def setup_display_config():
     """Setup display configuration with resolution selection"""
@@ -186,10 +192,8 @@ def setup_display_config():
 
 # Clear any cached modules to ensure fresh import
 import sys
-if 'config.experiment_config' in sys.modules:
-    del sys.modules['config.experiment_config']
-if 'experiment_config' in sys.modules:
-    del sys.modules['experiment_config']
+sys.modules.pop('config.experiment_config', None)
+sys.modules.pop('experiment_config', None)
 
 # Import config FIRST before anything else
 import config.experiment_config as config
@@ -222,10 +226,9 @@ print(f"   Before: DEMO_MODE = {config.DEMO_MODE}")
 print(f"   Before: SART trials = {config.SART_PARAMS['total_trials']}")
 
 # Force FULL experiment settings
-config.DEMO_MODE = False
-config.SART_PARAMS['total_trials'] = 120  # Full experiment trials
-config.SART_PARAMS['trials_per_step_min'] = 13  # Full experiment range
-config.SART_PARAMS['trials_per_step_max'] = 17  # Full experiment range
+config.set_demo_mode(False)
+# This launcher has always run the full SART block as a single step
+config.SART_PARAMS['steps_per_block'] = 1
 
 print(f"   After: DEMO_MODE = {config.DEMO_MODE}")
 print(f"   After: SART trials = {config.SART_PARAMS['total_trials']}")
@@ -250,8 +253,7 @@ print("=" * 60)
 # Import main experiment
 print("📦 Importing main experiment class...")
 print("   Forcing config module in sys.modules...")
-sys.modules['config'] = config
-sys.modules['experiment_config'] = config
+sys.modules.update({'config': config, 'experiment_config': config})
 
 try:
     if sys.platform == 'darwin':
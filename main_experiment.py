@@ -9,19 +9,23 @@ Date: 2024
 """
 
 import os
+import gc
 import warnings
 import logging
 import sys
 
 # Create a custom stream that filters out RGB warnings
 class FilteredStream:
+    FILTERED_PATTERNS = ('RGB parameter is deprecated', 'fillRGB', 'lineRGB')
+
     def __init__(self, stream):
         self.stream = stream
         self.suppress_next = False
         
     def write(self, text):
         # Filter out RGB-related warnings
-        if any(x in str(text) for x in ['RGB parameter is deprecated', 'fillRGB', 'lineRGB']):
+        message = str(text)
+        if any(pattern in message for pattern in self.FILTERED_PATTERNS):
             return
         self.stream.write(text)
     
@@ -65,9 +69,13 @@ import datetime
 from pathlib import Path
 import numpy as np
 
-# Add config and scripts directories to path
-sys.path.append(str(Path(__file__).parent / 'config'))
-sys.path.append(str(Path(__file__).parent / 'scripts'))
+# Directory holding this script, with config/ and scripts/ alongside it
+SCRIPT_DIR = Path(__file__).parent
+
+# Add config and scripts directories to path (skipping any a launcher already added)
+for extra_dir in (str(SCRIPT_DIR / 'config'), str(SCRIPT_DIR / 'scripts')):
+    if extra_dir not in sys.path:
+        sys.path.append(extra_dir)
 
 from psychopy import visual, core, event, sound
 from psychopy.hardware import keyboard
@@ -683,31 +691,42 @@ class MoodSARTExperimentSimple:
         self.preloaded_audio = {}
         print("🎵 Preloading audio files...")
         
-        for audio_key, audio_path in config.AUDIO_FILES.items():
-            if audio_path.exists():
+        audio_items = [(audio_key, audio_path) for audio_key, audio_path in config.AUDIO_FILES.items()
+                       if audio_path.exists()]
+        if not audio_items:
+            return
+        
+        # Try pygame first (usually faster) - import and initialize the mixer once
+        try:
+            import pygame.mixer
+            if not pygame.mixer.get_init():
+                # Mac-specific audio configuration for better compatibility
+                if config.IS_MAC:
+                    pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=1024)
+                else:
+                    pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
+                pygame.mixer.init()
+            mixer = pygame.mixer
+        except Exception:
+            mixer = None
+        
+        for audio_key, audio_path in audio_items:
+            if mixer is not None:
                 try:
-                    # Try pygame first (usually faster)
-                    import pygame.mixer
-                    if not pygame.mixer.get_init():
-                        # Mac-specific audio configuration for better compatibility
-                        if config.IS_MAC:
-                            pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=1024)
-                        else:
-                            pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
-                        pygame.mixer.init()
-                    
-                    self.preloaded_audio[audio_key] = pygame.mixer.Sound(str(audio_path))
+                    self.preloaded_audio[audio_key] = mixer.Sound(str(audio_path))
                     print(f"  ✓ {audio_key}")
-                    
-                except Exception as e:
-                    try:
-                        # Fallback to PsychoPy
-                        self.preloaded_audio[audio_key] = sound.Sound(str(audio_path))
-                        print(f"  ✓ {audio_key} (PsychoPy)")
-                    except Exception as e2:
-                        print(f"  ✗ Failed: {audio_key} - {str(e2)[:50]}...")
-                        # Create a placeholder to avoid errors
-                        self.preloaded_audio[audio_key] = None
+                    continue
+                except Exception:
+                    pass
+
+            try:
+                # Fallback to PsychoPy
+                self.preloaded_audio[audio_key] = sound.Sound(str(audio_path))
+                print(f"  ✓ {audio_key} (PsychoPy)")
+            except Exception as e:
+                print(f"  ✗ Failed: {audio_key} - {str(e)[:50]}...")
+                # Create a placeholder to avoid errors
+                self.preloaded_audio[audio_key] = None
         
     def setup_video_preloader(self):
         """Set up video preloader to fix loading delays"""
@@ -1356,6 +1375,9 @@ Click on the slider to set your rating, then click the Continue button to procee
                 max_frames = max(int(expected_display_frames), 18000)
                 print(f"🔒 Adjusted safety limit to {max_frames} frames (2x duration at 60fps)")
             
+            # Run any pending garbage collection before the playback clock starts
+            gc.collect()
+            
             # CRITICAL: Explicitly start video playback
             video.play()
             print("▶️ Video.play() called - starting playback")
@@ -1377,105 +1399,113 @@ Click on the slider to set your rating, then click the Continue button to procee
             playback_start_time = core.getTime()
             print(f"⏰ Playback started at: {playback_start_time:.3f}")
             
-            while True:
-                # CRITICAL: Only draw video - NO TEXT during playback
-                video.draw()
-                self.win.flip()
-                frame_count += 1
+            # Keep the cyclic garbage collector out of the frame loop so a
+            # collection pause never lands mid-playback
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                while True:
+                    # CRITICAL: Only draw video - NO TEXT during playback
+                    video.draw()
+                    self.win.flip()
+                    frame_count += 1
                 
-                current_status = video.status
+                    current_status = video.status
                 
-                # Track status changes (only log significant ones)
-                if current_status == last_status:
-                    consecutive_same_status += 1
-                else:
-                    # Only log status changes that might indicate completion or issues
-                    if current_status == visual.FINISHED or consecutive_same_status > 60:
-                        print(f"📝 Video status: {last_status} → {current_status} (frame {frame_count})")
-                    consecutive_same_status = 0
-                    last_status = current_status
+                    # Track status changes (only log significant ones)
+                    if current_status == last_status:
+                        consecutive_same_status += 1
+                    else:
+                        # Only log status changes that might indicate completion or issues
+                        if current_status == visual.FINISHED or consecutive_same_status > 60:
+                            print(f"📝 Video status: {last_status} → {current_status} (frame {frame_count})")
+                        consecutive_same_status = 0
+                        last_status = current_status
                 
-                # Progress updates every 5 seconds (300 frames at 60fps) instead of every second
-                if frame_count % 300 == 0:
-                    current_real_time = core.getTime()
-                    elapsed_time = current_real_time - playback_start_time
+                    # Progress updates every 5 seconds (300 frames at 60fps) instead of every second
+                    if frame_count % 300 == 0:
+                        current_real_time = core.getTime()
+                        elapsed_time = current_real_time - playback_start_time
                     
-                    if video_duration:
-                        progress_pct = (elapsed_time / video_duration) * 100
-                        remaining_time = max(0, video_duration - elapsed_time)
-                        print(f"🎞️ Video: {progress_pct:.0f}% complete ({elapsed_time:.0f}s/{video_duration:.0f}s, ~{remaining_time:.0f}s remaining)")
-                    else:
-                        print(f"🎞️ Video: {elapsed_time:.0f}s elapsed, frame {frame_count}")
+                        if video_duration:
+                            progress_pct = (elapsed_time / video_duration) * 100
+                            remaining_time = max(0, video_duration - elapsed_time)
+                            print(f"🎞️ Video: {progress_pct:.0f}% complete ({elapsed_time:.0f}s/{video_duration:.0f}s, ~{remaining_time:.0f}s remaining)")
+                        else:
+                            print(f"🎞️ Video: {elapsed_time:.0f}s elapsed, frame {frame_count}")
                 
-                # Check for quit key combination during playback
-                keys = event.getKeys(modifiers=True)
-                if self.check_quit_keys(keys):
-                    video_skipped = True
-                    print(f"🔄 Video skipped by user (ESC pressed) at frame {frame_count}")
-                    break
+                    # Check for quit key combination during playback
+                    keys = event.getKeys(modifiers=True)
+                    if self.check_quit_keys(keys):
+                        video_skipped = True
+                        print(f"🔄 Video skipped by user (ESC pressed) at frame {frame_count}")
+                        break
                 
-                # Method 1: Check if status changed to FINISHED
-                if current_status == visual.FINISHED:
-                    video_naturally_ended = True
-                    print(f"✅ Video finished (status = FINISHED)")
-                    break
+                    # Method 1: Check if status changed to FINISHED
+                    if current_status == visual.FINISHED:
+                        video_naturally_ended = True
+                        print(f"✅ Video finished (status = FINISHED)")
+                        break
                 
-                                # Method 2: Use video's actual time property if available (PRIMARY METHOD)
-                actual_video_time = None
-                try:
-                    if hasattr(video, '_player') and video._player and hasattr(video._player, 'time'):
-                        actual_video_time = video._player.time
-                        if video_duration and actual_video_time >= video_duration:
+                                    # Method 2: Use video's actual time property if available (PRIMARY METHOD)
+                    actual_video_time = None
+                    try:
+                        if hasattr(video, '_player') and video._player and hasattr(video._player, 'time'):
+                            actual_video_time = video._player.time
+                            if video_duration and actual_video_time >= video_duration:
+                                video_naturally_ended = True
+                                print(f"✅ Video finished (internal time reached duration)")
+                                break
+                        # Try VLC player time method
+                        elif hasattr(video, 'getCurrentFrameTime'):
+                            actual_video_time = video.getCurrentFrameTime()
+                            if video_duration and actual_video_time >= video_duration:
+                                video_naturally_ended = True
+                                print(f"✅ Video finished (frame time reached duration)")
+                                break
+                        # DISABLED: Percentage completion method (unreliable)
+                        # elif hasattr(video, 'getPercentageComplete'):
+                        #     percentage = video.getPercentageComplete()
+                        #     if percentage >= 99.0:  # 99% to account for rounding
+                        #         video_naturally_ended = True
+                        #         print(f"✅ Video percentage reached completion ({percentage:.1f}% >= 99%)")
+                        #         break
+                    except Exception as e:
+                        print(f"⚠️ Video time check failed: {e}")
+
+                    # Method 3: Use REAL ELAPSED TIME (most accurate)
+                    if video_duration:
+                        current_real_time = core.getTime()
+                        elapsed_time = current_real_time - playback_start_time
+                        if elapsed_time >= video_duration:
                             video_naturally_ended = True
-                            print(f"✅ Video finished (internal time reached duration)")
+                            print(f"✅ Video finished (elapsed time reached duration)")
                             break
-                    # Try VLC player time method
-                    elif hasattr(video, 'getCurrentFrameTime'):
-                        actual_video_time = video.getCurrentFrameTime()
-                        if video_duration and actual_video_time >= video_duration:
+                
+                                    # Method 4: Safety fallback - only if REAL elapsed time is way beyond expected
+                    if video_duration:
+                        current_real_time = core.getTime()
+                        elapsed_time = current_real_time - playback_start_time
+                        # Only trigger if we're 30+ seconds past expected duration (something is really wrong)
+                        if elapsed_time > (video_duration + 30) and consecutive_same_status > 300:
+                            print(f"⚠️ SAFETY: Video exceeded expected duration - forcing completion")
+                            video_naturally_ended = True
+                            break
+                    else:
+                        # Fallback if no duration available - use longer time limits
+                        if consecutive_same_status > 1800 and frame_count > 7200:  # 1 minute unchanged after 4 minutes
+                            print(f"⚠️ SAFETY: Video appears stuck - forcing completion")
                             video_naturally_ended = True
-                            print(f"✅ Video finished (frame time reached duration)")
                             break
-                    # DISABLED: Percentage completion method (unreliable)
-                    # elif hasattr(video, 'getPercentageComplete'):
-                    #     percentage = video.getPercentageComplete()
-                    #     if percentage >= 99.0:  # 99% to account for rounding
-                    #         video_naturally_ended = True
-                    #         print(f"✅ Video percentage reached completion ({percentage:.1f}% >= 99%)")
-                    #         break
-                except Exception as e:
-                    print(f"⚠️ Video time check failed: {e}")
-
-                # Method 3: Use REAL ELAPSED TIME (most accurate)
-                if video_duration:
-                    current_real_time = core.getTime()
-                    elapsed_time = current_real_time - playback_start_time
-                    if elapsed_time >= video_duration:
-                        video_naturally_ended = True
-                        print(f"✅ Video finished (elapsed time reached duration)")
-                        break
                 
-                                # Method 4: Safety fallback - only if REAL elapsed time is way beyond expected
-                if video_duration:
-                    current_real_time = core.getTime()
-                    elapsed_time = current_real_time - playback_start_time
-                    # Only trigger if we're 30+ seconds past expected duration (something is really wrong)
-                    if elapsed_time > (video_duration + 30) and consecutive_same_status > 300:
-                        print(f"⚠️ SAFETY: Video exceeded expected duration - forcing completion")
+                    # Safety: Absolute maximum to prevent infinite loops
+                    if frame_count >= max_frames:
+                        print(f"⚠️ SAFETY: Frame limit reached - forcing completion")
                         video_naturally_ended = True
                         break
-                else:
-                    # Fallback if no duration available - use longer time limits
-                    if consecutive_same_status > 1800 and frame_count > 7200:  # 1 minute unchanged after 4 minutes
-                        print(f"⚠️ SAFETY: Video appears stuck - forcing completion")
-                        video_naturally_ended = True
-                        break
-                
-                # Safety: Absolute maximum to prevent infinite loops
-                if frame_count >= max_frames:
-                    print(f"⚠️ SAFETY: Frame limit reached - forcing completion")
-                    video_naturally_ended = True
-                    break
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
             
             # Video playback completed
             
@@ -1579,14 +1609,12 @@ Click on the slider to set your rating, then click the Continue button to procee
         
         # Get statements from configuration
         if set_key in config.VELTEN_STATEMENTS:
-            statements = config.VELTEN_STATEMENTS[set_key].copy()  # Copy to avoid modifying original
-            
             # IMPORTANT: Do NOT randomize - statements must be presented in exact order
+            # Demo mode gets the precomputed shortened set (first DEMO_VELTEN_STATEMENT_COUNT statements)
+            statements = config.get_velten_statements(set_key, demo=config.DEMO_MODE)
             
-            # Apply demo mode reduction BEFORE printing the count
             if config.DEMO_MODE:
-                original_count = len(statements)
-                statements = statements[:2]  # Only use first 2 statements in demo
+                original_count = len(config.VELTEN_STATEMENTS[set_key])
                 print(f"Loaded {len(statements)} {valence} statements from {set_key} ({phase_type}) - Demo mode (reduced from {original_count})")
             else:
                 print(f"Loaded {len(statements)} {valence} statements from {set_key} ({phase_type})")
@@ -1610,8 +1638,8 @@ Click on the slider to set your rating, then click the Continue button to procee
                     ]
                 # Apply demo mode reduction to fallback statements too
                 if config.DEMO_MODE:
-                    statements = statements[:2]  # Only use first 2 statements in demo
-                print(f"Using fallback {valence} statements (file not found) - {'Demo mode: 2 statements' if config.DEMO_MODE else 'Full: 3 statements'}")
+                    statements = statements[:config.DEMO_VELTEN_STATEMENT_COUNT]  # Only use the first few statements in demo
+                print(f"Using fallback {valence} statements (file not found) - {f'Demo mode: {config.DEMO_VELTEN_STATEMENT_COUNT} statements' if config.DEMO_MODE else 'Full: 3 statements'}")
             else:
                 # Load statements from file
                 with open(statements_file, 'r') as f:
@@ -1619,7 +1647,7 @@ Click on the slider to set your rating, then click the Continue button to procee
                 # Apply demo mode reduction to file-loaded statements too
                 if config.DEMO_MODE:
                     original_count = len(statements)
-                    statements = statements[:2]  # Only use first 2 statements in demo
+                    statements = statements[:config.DEMO_VELTEN_STATEMENT_COUNT]  # Only use the first few statements in demo
                     print(f"Loaded {len(statements)} {valence} statements from file - Demo mode (reduced from {original_count})")
                 else:
                     print(f"Loaded {len(statements)} {valence} statements from file")
@@ -3251,6 +3279,9 @@ Current rating: {}"""
         # Show loading screen
         loading_screen = create_loading_screen(self.win, "Loading experiment materials, please wait...")
         
+        # Start pulling the video files into the page cache while the loading screen is up
+        self.video_preloader.warm_page_cache()
+        
         # Preload all videos
         self.video_preloader.preload_all_videos()
         
@@ -12,7 +12,9 @@ from pathlib import Path
 import numpy as np
 
 # Add config to path
-sys.path.append(str(Path(__file__).parent.parent / 'config'))
+config_dir = str(Path(__file__).parent.parent / 'config')
+if config_dir not in sys.path:
+    sys.path.append(config_dir)
 import experiment_config as config
 
 def generate_sample_participant_data(participant_id, condition):
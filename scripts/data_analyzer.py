@@ -15,7 +15,9 @@ from pathlib import Path
 import sys
 
 # Add config to path
-sys.path.append(str(Path(__file__).parent.parent / 'config'))
+config_dir = str(Path(__file__).parent.parent / 'config')
+if config_dir not in sys.path:
+    sys.path.append(config_dir)
 import experiment_config as config
 
 class MoodSARTAnalyzer:
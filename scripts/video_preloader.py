@@ -4,6 +4,7 @@ Video Preloader for PsychoPy Experiment
 Addresses the known issue of video loading delays by preloading videos during intro screens.
 """
 
+import os
 import sys
 from pathlib import Path
 from psychopy import visual, core
@@ -11,23 +12,31 @@ import threading
 import queue
 
 # Add config to path
-sys.path.append(str(Path(__file__).parent.parent / 'config'))
+config_dir = str(Path(__file__).parent.parent / 'config')
+if config_dir not in sys.path:
+    sys.path.append(config_dir)
 import experiment_config as config
 
 class VideoPreloader:
     """Preloads videos to reduce loading delays during experiment"""
     
-    def __init__(self, win):
-        """Initialize preloader with PsychoPy window"""
+    def __init__(self, win, debug=False):
+        """Initialize preloader with PsychoPy window
+        
+        Set debug=True to print the window/video sizing diagnostics for each clip.
+        """
         self.win = win
+        self.debug = debug
         self.preloaded_videos = {}
         self.loading_queue = queue.Queue()
         self.loading_thread = None
         
     def preload_video(self, video_key, video_path):
         """Preload a single video"""
+        # Convert once; the existence check and both MovieStim attempts take the plain string
+        video_path = os.fspath(video_path)
         try:
-            if video_path.exists():
+            if os.path.exists(video_path):
                 # Get window size for video scaling
                 import config
                 import sys
@@ -43,37 +52,43 @@ class VideoPreloader:
                         raw_window_size[1] > config_size[1] * 1.8):
                         # Use the configured size instead of the reported size
                         window_size = config_size
-                        print(f"🔍 DEBUG - Retina Display Detected (auto-corrected):")
-                        print(f"   Reported size: {raw_window_size[0]}x{raw_window_size[1]} (physical pixels)")
-                        print(f"   Using logical size: {window_size[0]}x{window_size[1]}")
+                        if self.debug:
+                            print(f"🔍 DEBUG - Retina Display Detected (auto-corrected):")
+                            print(f"   Reported size: {raw_window_size[0]}x{raw_window_size[1]} (physical pixels)")
+                            print(f"   Using logical size: {window_size[0]}x{window_size[1]}")
                     else:
                         window_size = config_size
-                        print(f"🔍 DEBUG - Video Preloader Sizing:")
-                        print(f"   Using configured size: {window_size[0]}x{window_size[1]}")
+                        if self.debug:
+                            print(f"🔍 DEBUG - Video Preloader Sizing:")
+                            print(f"   Using configured size: {window_size[0]}x{window_size[1]}")
                 else:
                     # No config, check if this looks like Retina
                     if sys.platform == 'darwin' and raw_window_size[0] > 2500:
                         # Likely Retina, use half size
                         window_size = [raw_window_size[0] // 2, raw_window_size[1] // 2]
-                        print(f"🔍 DEBUG - Retina Display Detected (halved):")
-                        print(f"   Reported size: {raw_window_size[0]}x{raw_window_size[1]}")
-                        print(f"   Using logical size: {window_size[0]}x{window_size[1]}")
+                        if self.debug:
+                            print(f"🔍 DEBUG - Retina Display Detected (halved):")
+                            print(f"   Reported size: {raw_window_size[0]}x{raw_window_size[1]}")
+                            print(f"   Using logical size: {window_size[0]}x{window_size[1]}")
                     else:
                         window_size = raw_window_size
-                        print(f"🔍 DEBUG - Video Preloader Sizing:")
-                        print(f"   Window size: {window_size[0]}x{window_size[1]}")
+                        if self.debug:
+                            print(f"🔍 DEBUG - Video Preloader Sizing:")
+                            print(f"   Window size: {window_size[0]}x{window_size[1]}")
                 
-                print(f"   Window aspect ratio: {window_size[0]/window_size[1]:.2f}")
+                if self.debug:
+                    print(f"   Window aspect ratio: {window_size[0]/window_size[1]:.2f}")
                 
                 # Use corrected window size to ensure video fills screen completely
                 video_size = window_size  # Use corrected window size
-                print(f"📺 Setting video to fill entire window: {video_size[0]}x{video_size[1]}")
+                if self.debug:
+                    print(f"📺 Setting video to fill entire window: {video_size[0]}x{video_size[1]}")
                 
                 # Try different video components based on availability
                 try:
                     video = visual.MovieStim3(
                         win=self.win,
-                        filename=str(video_path),
+                        filename=video_path,
                         size=video_size,  # Full window size for complete screen fill
                         pos=(0, 0),
                         noAudio=False,
@@ -85,7 +100,7 @@ class VideoPreloader:
                     try:
                         video = visual.MovieStim(
                             win=self.win,
-                            filename=str(video_path),
+                            filename=video_path,
                             size=video_size,  # Full window size for complete screen fill
                             pos=(0, 0),
                             noAudio=False,
@@ -100,12 +115,13 @@ class VideoPreloader:
                 
                 # DEBUG: Print actual video dimensions after loading
                 if video:
-                    try:
-                        print(f"✓ {video_key}")
-                        print(f"   Actual video dimensions: {video.size}")
-                        print(f"   Video position: {video.pos}")
-                    except:
-                        print(f"✓ {video_key} (dimensions not available)")
+                    print(f"✓ {video_key}")
+                    if self.debug:
+                        try:
+                            print(f"   Actual video dimensions: {video.size}")
+                            print(f"   Video position: {video.pos}")
+                        except AttributeError:
+                            print("   (dimensions not available)")
             else:
                 print(f"❌ Video not found: {video_key}")
                 self.preloaded_videos[video_key] = None
@@ -113,6 +129,37 @@ class VideoPreloader:
             print(f"❌ Error preloading {video_key}: {e}")
             self.preloaded_videos[video_key] = None
     
+    def warm_page_cache(self):
+        """Ask the OS to start reading all video files into the page cache
+        
+        Returns immediately; the kernel fetches the files in the background while
+        the loading screen is up, so the later MovieStim opens read from memory.
+        Uses posix_fadvise on Linux and F_RDADVISE on macOS; a no-op on Windows.
+        """
+        use_fadvise = hasattr(os, 'posix_fadvise')
+        if not use_fadvise and sys.platform != 'darwin':
+            return
+        
+        for video_key, video_path in config.VIDEO_FILES.items():
+            try:
+                fd = os.open(video_path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                if use_fadvise:
+                    # Linux: length 0 means "to the end of the file"
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    # macOS: F_RDADVISE with a struct radvisory {off_t offset; int count}
+                    import fcntl
+                    import struct
+                    size = min(os.fstat(fd).st_size, 0x7FFFFFFF)
+                    fcntl.fcntl(fd, getattr(fcntl, 'F_RDADVISE', 44), struct.pack('qi4x', 0, size))
+            except OSError as e:
+                print(f"⚠️ Could not prefetch {video_key}: {e}")
+            finally:
+                os.close(fd)
+    
     def preload_all_videos(self):
         """Preload all experiment videos"""
         print("🎬 Preloading videos...")
@@ -124,10 +171,16 @@ class VideoPreloader:
     
     def preload_videos_background(self, video_keys):
         """Preload videos in background thread"""
+        # Deduplicate the requested keys and report typos instead of silently skipping them
+        requested = dict.fromkeys(video_keys)
+        for video_key in requested.keys() - config.VIDEO_FILES.keys():
+            print(f"⚠️ Unknown video key: {video_key}")
+        video_items = [(video_key, config.VIDEO_FILES[video_key])
+                       for video_key in requested if video_key in config.VIDEO_FILES]
+        
         def background_loader():
-            for video_key in video_keys:
-                if video_key in config.VIDEO_FILES:
-                    self.preload_video(video_key, config.VIDEO_FILES[video_key])
+            for video_key, video_path in video_items:
+                self.preload_video(video_key, video_path)
         
         self.loading_thread = threading.Thread(target=background_loader)
         self.loading_thread.daemon = True
@@ -188,6 +241,7 @@ def demo_preloader():
         
         # Create preloader
         preloader = VideoPreloader(win)
+        preloader.warm_page_cache()
         
         # Preload videos
         preloader.preload_all_videos()
@@ -6,6 +6,8 @@ Helps users set up the experiment environment and validate installation.
 
 import os
 import sys
+import time
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -38,11 +40,20 @@ def install_requirements():
         print("❌ requirements.txt not found")
         return False
     
+    # Prefer uv when it is installed (much faster resolver and parallel downloads),
+    # targeting this same interpreter; otherwise fall back to pip
+    if shutil.which("uv"):
+        installer = "uv"
+        command = ["uv", "pip", "install", "--python", sys.executable, "-r", str(requirements_file)]
+    else:
+        installer = "pip"
+        command = [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)]
+    
     try:
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "-r", str(requirements_file)
-        ])
-        print("✅ Requirements installed successfully")
+        start_time = time.perf_counter()
+        subprocess.check_call(command)
+        elapsed = time.perf_counter() - start_time
+        print(f"✅ Requirements installed successfully with {installer} ({elapsed:.1f}s)")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to install requirements: {e}")
@@ -69,6 +80,13 @@ def create_directories():
     
     return True
 
+def list_files(directory):
+    """Return the names of the files in a directory (empty set if it doesn't exist)"""
+    if not directory.exists():
+        return set()
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
 def create_placeholder_files():
     """Create placeholder files for missing stimuli"""
     print("\nChecking stimulus files...")
@@ -87,9 +105,11 @@ def create_placeholder_files():
     videos_dir = base_dir / "stimuli" / "videos"
     missing_videos = []
     
+    # One directory scan; names it doesn't match exactly (e.g. different case on
+    # case-insensitive filesystems) still get an exists() check
+    present_videos = list_files(videos_dir)
     for video_file in video_files:
-        video_path = videos_dir / video_file
-        if video_path.exists():
+        if video_file in present_videos or (videos_dir / video_file).exists():
             print(f"✅ Video found: {video_file}")
         else:
             print(f"⚠️  Video missing: {video_file}")
@@ -104,9 +124,9 @@ def create_placeholder_files():
     audio_dir = base_dir / "stimuli" / "audio"
     missing_audio = []
     
+    present_audio = list_files(audio_dir)
     for audio_file in audio_files:
-        audio_path = audio_dir / audio_file
-        if audio_path.exists():
+        if audio_file in present_audio or (audio_dir / audio_file).exists():
             print(f"✅ Audio found: {audio_file}")
         else:
             print(f"⚠️  Audio missing: {audio_file}")
@@ -114,31 +134,24 @@ def create_placeholder_files():
     
     # Create README for stimulus files
     if missing_videos or missing_audio:
-        readme_content = """# STIMULUS FILES NEEDED
-
-## Video Files (place in stimuli/videos/):
-"""
-        for video in missing_videos:
-            readme_content += f"- {video}\n"
-        
-        readme_content += """
-## Audio Files (place in stimuli/audio/):
-"""
-        for audio in missing_audio:
-            readme_content += f"- {audio}\n"
-        
-        readme_content += """
-## Notes:
-- Video files should be .mp4 format
-- Audio files should be .wav format
-- The experiment will show placeholders for missing video files
-- Missing audio files will be skipped during Velten procedures
-- All files are optional for testing purposes
-"""
-        
         readme_path = base_dir / "stimuli" / "STIMULUS_FILES_NEEDED.md"
-        with open(readme_path, 'w') as f:
-            f.write(readme_content)
+        readme_path.write_text("\n".join([
+            "# STIMULUS FILES NEEDED",
+            "",
+            "## Video Files (place in stimuli/videos/):",
+            *[f"- {video}" for video in missing_videos],
+            "",
+            "## Audio Files (place in stimuli/audio/):",
+            *[f"- {audio}" for audio in missing_audio],
+            "",
+            "## Notes:",
+            "- Video files should be .mp4 format",
+            "- Audio files should be .wav format",
+            "- The experiment will show placeholders for missing video files",
+            "- Missing audio files will be skipped during Velten procedures",
+            "- All files are optional for testing purposes",
+            "",
+        ]))
         
         print(f"✅ Created stimulus guide: {readme_path}")
     